@@ -104,7 +104,9 @@ class _ClangBasedTargetInfo(TargetInfo, ABC):
         super().__init__(target, project)
         self._sdk_root_dir: Optional[Path] = None
 
-    @property
+    # Cached since it is used for every compiler/tool path and the -B flag. Reusing the same Path object also means that
+    # pathlib only has to compute the string form once.
+    @cached_property
     def _compiler_dir(self) -> Path:
         return self.sdk_root_dir / "bin"
 
@@ -126,7 +128,10 @@ class _ClangBasedTargetInfo(TargetInfo, ABC):
     def toolchain_targets(cls, target: "CrossCompileTarget", config: "CheriConfig") -> "list[str]":
         return [cls._get_compiler_project().get_class_for_target(BasicCompilationTargets.NATIVE_NON_PURECAP).target]
 
-    def _rootfs_path(self) -> Path:
+    # Cached since every project that installs to the rootfs queries this (potentially multiple times) to compute its
+    # default install directory, and each lookup has to find the rootfs project instance.
+    @cached_property
+    def _rootfs_dir(self) -> Path:
         xtarget = self.target.get_rootfs_target()
         # noinspection PyUnresolvedReferences
         return self._get_rootfs_class(xtarget).get_install_dir(self.project, xtarget)
@@ -136,11 +141,11 @@ class _ClangBasedTargetInfo(TargetInfo, ABC):
             project = self.project
             if hasattr(project, "path_in_rootfs"):
                 assert project.path_in_rootfs.startswith("/"), project.path_in_rootfs
-                return self._rootfs_path() / project.path_in_rootfs[1:]
+                return self._rootfs_dir / project.path_in_rootfs[1:]
             # noinspection PyUnresolvedReferences,PyProtectedMember
-            return self._rootfs_path() / "opt" / self.install_prefix_dirname / project._rootfs_install_dir_name
+            return self._rootfs_dir / "opt" / self.install_prefix_dirname / project._rootfs_install_dir_name
         elif install_dir == DefaultInstallDir.KDE_PREFIX:
-            return Path(self._rootfs_path(), "opt", self.install_prefix_dirname, "kde")
+            return Path(self._rootfs_dir, "opt", self.install_prefix_dirname, "kde")
         elif install_dir == DefaultInstallDir.ROOTFS_LOCALBASE:
             return self.sysroot_dir
         return super().default_install_dir(install_dir)
@@ -367,14 +372,15 @@ class FreeBSDTargetInfo(_ClangBasedTargetInfo):
             return self._get_compiler_project().get_native_install_path(self.config)
         return configured_path
 
-    @property
+    # Cached since this is queried many times per project (e.g. via sdk_sysroot) and looking up the rootfs install
+    # directory is not free. The value only depends on the configuration, so it can't change after the first access.
+    @cached_property
     def sysroot_dir(self) -> Path:
         if is_jenkins_build():
             # Jenkins builds compile against a sysroot that was extracted to sdk/sysroot directory and not the
             # full rootfs
             return self.get_non_rootfs_sysroot_dir()
-        xtarget = self.target.get_rootfs_target()
-        return self._get_rootfs_class(xtarget).get_install_dir(self.project, cross_target=xtarget)
+        return self._rootfs_dir
 
     def get_non_rootfs_sysroot_dir(self) -> Path:
         if is_jenkins_build():
@@ -342,12 +342,29 @@ class FileSystemUtils:
     def triple_prefixes_for_binaries(self) -> typing.Iterable[str]:
         raise ValueError("Must override triple_prefixes_for_binaries to use create_triple_prefixed_symlinks!")
 
+    def _force_symlink(self, src: str, link: Path) -> None:
+        # Equivalent to `ln -fsn src link`, but avoids spawning a process for every link (we create lots of them for
+        # the triple-prefixed tools). Replacing a temporary symlink ensures the link always exists.
+        print_command("ln", "-fsn", src, link.name, cwd=link.parent, print_verbose_only=True, config=self.config)
+        if link.is_dir() and not link.is_symlink():
+            # ln -fsn would create the link inside the directory, which is never what we want here.
+            fatal_error("Cannot create symlink", link, "since it is an existing directory", pretend=self.config.pretend)
+            return
+        if self.config.pretend:
+            return
+        tmp_link = link.with_name(link.name + ".tmp-symlink")
+        if tmp_link.is_symlink() or tmp_link.exists():
+            tmp_link.unlink()
+        os.symlink(src, tmp_link)
+        os.replace(tmp_link, link)
+
     def create_triple_prefixed_symlinks(
         self,
         tool_path: Path,
         tool_name: "Optional[str]" = None,
         create_unprefixed_link: bool = False,
         cwd: "Optional[str]" = None,
+        triple_prefixes: "Optional[typing.Iterable[str]]" = None,
     ) -> None:
         """
         Create mips4-unknown-freebsd, cheri-unknown-freebsd and mips64-unknown-freebsd prefixed symlinks
@@ -357,10 +374,13 @@ class FileSystemUtils:
         :param cwd: the working directory
         :param tool_path: the binary for which the symlinks will be created
         :param tool_name: the unprefixed name of the tool_path (defaults to tool_path.name) such as e.g. "ld", "ar"
+        :param triple_prefixes: the prefixes to use (defaults to self.triple_prefixes_for_binaries)
         """
         cwd = cwd or tool_path.parent  # set cwd before resolving potential symlink
         if not tool_name:
             tool_name = tool_path.name
+        if triple_prefixes is None:
+            triple_prefixes = self.triple_prefixes_for_binaries
         if not tool_path.is_file():
             fatal_error(
                 "Attempting to create symlink to non-existent build tool_path:", tool_path, pretend=self.config.pretend
@@ -369,17 +389,21 @@ class FileSystemUtils:
         # a prefixed tool_path was installed -> create link such as mips4-unknown-freebsd-ld -> ld
         if create_unprefixed_link:
             assert tool_path.name != tool_name
-            run_command("ln", "-fsn", tool_path.name, tool_name, cwd=cwd, print_verbose_only=True, config=self.config)
+            self._force_symlink(tool_path.name, Path(cwd, tool_name))
 
-        for target in self.triple_prefixes_for_binaries:
+        for target in triple_prefixes:
             link = tool_path.parent / (target + tool_name)
             if link == tool_path:  # happens for binutils, where prefixed tools are installed
                 # if self.config.verbose:
                 #    print(coloured(AnsiColour.yellow, "Not overwriting", link, "because it is the target"))
                 continue
-            run_command(
-                "ln", "-fsn", tool_path.name, target + tool_name, cwd=cwd, print_verbose_only=True, config=self.config
-            )
+            self._force_symlink(tool_path.name, Path(cwd, target + tool_name))
+
+    def create_triple_prefixed_symlinks_for_tools(self, tool_paths: "typing.Iterable[Path]") -> None:
+        """Same as calling create_triple_prefixed_symlinks() for each tool, but only computes the prefixes once."""
+        triple_prefixes = list(self.triple_prefixes_for_binaries)
+        for tool_path in tool_paths:
+            self.create_triple_prefixed_symlinks(tool_path, triple_prefixes=triple_prefixes)
 
     @staticmethod
     # Not cached since another target could write to this dir: @functools.lru_cache(maxsize=20)
@@ -725,6 +725,11 @@ class CompilerInfo:
 
 
 _cached_compiler_infos: "dict[Path, CompilerInfo]" = {}
+# Match all supported compilers with a single pattern to avoid scanning the output once per compiler kind.
+# Note: "Apple clang version" is matched by the Apple alternative since it starts before "clang version".
+_COMPILER_VERSION_RE = re.compile(rb"(gcc|Apple (?:clang|LLVM)|clang) version (\d+)\.(\d+)\.?(\d+)?")
+# TODO: could also use -dumpmachine to get the triple
+_COMPILER_TARGET_RE = re.compile(rb"Target: (.+)")
 
 
 def get_compiler_info(compiler: "Union[str, Path]", *, config: ConfigBase) -> CompilerInfo:
@@ -738,21 +743,17 @@ def get_compiler_info(compiler: "Union[str, Path]", *, config: ConfigBase) -> Co
     kind = "unknown compiler"
     version = (0, 0, 0)
     version_str = "unknown version"
+    requested_compiler = compiler
     if compiler not in _cached_compiler_infos:
         if not compiler.exists():
             # Don't try to cache output for a non-existent compiler (e.g. CHERI LLVM before it was built).
             return CompilerInfo(compiler, kind, version, version_str, default_target="", config=config)
         # Avoid querying the same compiler twice if it is a symlink
-        compiler_realpath = compiler.resolve() if compiler.exists() else compiler
+        compiler_realpath = compiler.resolve()
         if compiler_realpath in _cached_compiler_infos:
             _cached_compiler_infos[compiler] = _cached_compiler_infos[compiler_realpath]
         compiler = compiler_realpath
     if compiler not in _cached_compiler_infos:
-        clang_version_pattern = re.compile(rb"clang version (\d+)\.(\d+)\.?(\d+)?")
-        gcc_version_pattern = re.compile(rb"gcc version (\d+)\.(\d+)\.?(\d+)?")
-        apple_llvm_version_pattern = re.compile(rb"Apple (?:clang|LLVM) version (\d+)\.(\d+)\.?(\d+)?")
-        # TODO: could also use -dumpmachine to get the triple
-        target_pattern = re.compile(rb"Target: (.+)")
         executed_sucessfully = True
         # clang prints this output to stderr
         try:
@@ -776,31 +777,24 @@ def get_compiler_info(compiler: "Union[str, Path]", *, config: ConfigBase) -> Co
             version_cmd = CompletedProcess([compiler, "-v"], e.errno, b"", str(e).encode("utf-8"))
             executed_sucessfully = False
 
-        clang_version = clang_version_pattern.search(version_cmd.stderr)
-        apple_llvm_version = apple_llvm_version_pattern.search(version_cmd.stderr)
-        gcc_version = gcc_version_pattern.search(version_cmd.stderr)
-        target = target_pattern.search(version_cmd.stderr)
+        compiler_version = _COMPILER_VERSION_RE.search(version_cmd.stderr)
+        target = _COMPILER_TARGET_RE.search(version_cmd.stderr)
         target_string = target.group(1).decode("utf-8") if target else ""
-        if gcc_version:
-            kind = "gcc"
-            version = tuple(map(int, gcc_version.groups()))
-            version_str = gcc_version.group(0).decode("utf-8")
-        elif apple_llvm_version:
-            kind = "apple-clang"
-            version = tuple(map(int, apple_llvm_version.groups()))
-            version_str = apple_llvm_version.group(0).decode("utf-8")
-        elif clang_version:
-            kind = "clang"
-            version = tuple(map(int, clang_version.groups()))
-            version_str = clang_version.group(0).decode("utf-8")
+        if compiler_version:
+            compiler_name = compiler_version.group(1)
+            kind = compiler_name.decode("utf-8") if compiler_name in (b"gcc", b"clang") else "apple-clang"
+            version = tuple(map(int, compiler_version.groups()[1:]))
+            version_str = compiler_version.group(0).decode("utf-8")
         else:
             warning_message("Could not detect compiler info for", compiler, "- output was", version_cmd.stderr)
         if config.verbose:
             print(compiler, "is", kind, "version", version, "with default target", target_string)
         result = CompilerInfo(compiler, kind, version, version_str, target_string, config=config)
         # Don't cache the result if the -v command failed (e.g. compiler doesn't exist yet)
+        # Also cache it for the requested path to avoid resolving symlinks (e.g. /usr/bin/cc) on every lookup.
         if executed_sucessfully:
             _cached_compiler_infos[compiler] = result
+            _cached_compiler_infos[requested_compiler] = result
         return result
     return _cached_compiler_infos[compiler]
 
@@ -515,6 +515,11 @@ class BuildQEMU(BuildQEMUBase):
 
     def install(self, **kwargs):
         super().install(**kwargs)
+        # Find the old icons with a single walk of share/icons instead of recursively searching the entire SDK
+        # directory once per file extension.
+        old_icons = []
+        for root, _, files in os.walk(self.config.morello_sdk_dir / "share/icons"):
+            old_icons.extend(Path(root, f) for f in files if f in ("qemu.png", "qemu.bmp", "qemu.svg"))
         # Delete the old Morello-QEMU files
         self._cleanup_old_files(
             self.config.morello_sdk_dir / "share/qemu",
@@ -524,7 +529,5 @@ class BuildQEMU(BuildQEMUBase):
             self.config.morello_sdk_dir / "bin/elf2dmp",
             self.config.morello_sdk_dir / "bin/symbolize-cheri-trace.py",
             *(self.config.morello_sdk_dir / "bin").glob("qemu-*"),
-            *self.config.morello_sdk_dir.rglob("share/icons/**/qemu.png"),
-            *self.config.morello_sdk_dir.rglob("share/icons/**/qemu.bmp"),
-            *self.config.morello_sdk_dir.rglob("share/icons/**/qemu.svg"),
+            *old_icons,
         )
@@ -419,10 +419,11 @@ class MakefileProject(Project):
 
         # Set values in the environment so that projects can override them
         cppflags = self.default_compiler_flags
+        cflags = commandline_to_str(cppflags + self.CFLAGS)  # CPPFLAGS uses the same value, only quote it once
         self.make_args.set_env(
-            CFLAGS=commandline_to_str(cppflags + self.CFLAGS),
+            CFLAGS=cflags,
             CXXFLAGS=commandline_to_str(cppflags + self.CXXFLAGS),
-            CPPFLAGS=commandline_to_str(cppflags + self.CFLAGS),
+            CPPFLAGS=cflags,
             LDFLAGS=commandline_to_str(self.default_ldflags + self.LDFLAGS),
         )
 
@@ -74,6 +74,9 @@ __all__ = [
 ]
 
 
+# Flags variables that CrossCompileAutotoolsProject.configure() sets itself and must not be set by subclasses.
+_AUTOTOOLS_FLAGS_VARIABLES = frozenset({"CFLAGS", "CXXFLAGS", "CPPFLAGS", "LDFLAGS"})
+
 if typing.TYPE_CHECKING:
     _CrossCompileMixinBase = SimpleProject
 else:
@@ -160,15 +163,20 @@ class CrossCompileAutotoolsProject(CrossCompileMixin, AutotoolsProject):
     def configure(self, **kwargs):
         if self._autotools_add_default_compiler_args:
             cppflags = self.default_compiler_flags
-            for key in ("CFLAGS", "CXXFLAGS", "CPPFLAGS", "LDFLAGS"):
-                assert key not in self.configure_environment, key
+            assert _AUTOTOOLS_FLAGS_VARIABLES.isdisjoint(self.configure_environment), (
+                _AUTOTOOLS_FLAGS_VARIABLES & self.configure_environment.keys()
+            )
             # We have to include -target xxx-unknown-freebsd as part of CC for some build systems since they fail
             # if a plain $CC can't compile programs.
             self.set_configure_prog_with_args("CC", self.CC, self.essential_compiler_and_linker_flags)
             self.set_configure_prog_with_args("CXX", self.CXX, self.essential_compiler_and_linker_flags)
             # self.add_configure_env_arg("CPPFLAGS", self.commandline_to_str(CPPFLAGS))
-            self.add_configure_env_arg("CFLAGS", self.commandline_to_str(cppflags + self.CFLAGS))
-            self.add_configure_env_arg("CXXFLAGS", self.commandline_to_str(cppflags + self.CXXFLAGS))
+            # Only quote the (long) list of common flags once and reuse it for both CFLAGS and CXXFLAGS.
+            cppflags_str = self.commandline_to_str(cppflags)
+            cflags_str = self.commandline_to_str(self.CFLAGS)
+            cxxflags_str = self.commandline_to_str(self.CXXFLAGS)
+            self.add_configure_env_arg("CFLAGS", " ".join(x for x in (cppflags_str, cflags_str) if x))
+            self.add_configure_env_arg("CXXFLAGS", " ".join(x for x in (cppflags_str, cxxflags_str) if x))
             # this one seems to work:
             self.add_configure_env_arg("LDFLAGS", self.commandline_to_str(self.LDFLAGS + self.default_ldflags))
 
@@ -181,20 +189,29 @@ class CrossCompileAutotoolsProject(CrossCompileMixin, AutotoolsProject):
         env = {k: v for k, v in self.configure_environment.items() if v}
         self.configure_environment.clear()
         self.configure_environment.update(env)
-        self.print(
-            coloured(
-                AnsiColour.yellow,
-                "Cross configure environment:\n\t",
-                "\n\t".join(k + "=" + str(v) for k, v in self.configure_environment.items()),
+        # Only format the environment when it will actually be printed.
+        if self.config.verbose:
+            print(
+                coloured(
+                    AnsiColour.yellow,
+                    "Cross configure environment:\n\t",
+                    "\n\t".join(k + "=" + str(v) for k, v in self.configure_environment.items()),
+                )
             )
-        )
         super().configure(**kwargs)
 
     def process(self):
         if not self.compiling_for_host():
             # We run all these commands with $PATH containing $CHERI_SDK/bin to ensure the right tools are used
-            with self.set_env(PATH=str(self.sdk_bindir) + ":" + os.getenv("PATH")):
+            sdk_bindir = str(self.sdk_bindir)
+            old_path = os.getenv("PATH", "")
+            if old_path == sdk_bindir or old_path.startswith(sdk_bindir + ":"):
+                # $PATH already starts with the SDK bindir, no need to modify (and later restore) the environment.
                 super().process()
+            else:
+                # Don't append an empty entry for an unset/empty $PATH since that would add the current directory.
+                with self.set_env(PATH=sdk_bindir + ":" + old_path if old_path else sdk_bindir):
+                    super().process()
         else:
             # when building the native target we just rely on the host tools in /usr/bin
             super().process()
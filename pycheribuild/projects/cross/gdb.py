@@ -198,11 +198,16 @@ class BuildGDBBase(CrossCompileAutotoolsProject):
             # Add -lelf to the linker command line until the source is fixed
             self.LDFLAGS.append("-lelf")
             self.LDFLAGS.append("-lmd")
-            self.configure_environment.update(CONFIGURED_M4="m4", CONFIGURED_BISON="byacc", TMPDIR="/tmp", LIBS="")
-            self.configure_environment["CC_FOR_BUILD"] = str(self.host_CC)
-            self.configure_environment["CXX_FOR_BUILD"] = str(self.host_CXX)
-            self.configure_environment["CFLAGS_FOR_BUILD"] = "-g -fcommon"
-            self.configure_environment["CXXFLAGS_FOR_BUILD"] = "-g -fcommon"
+            self.configure_environment.update(
+                CONFIGURED_M4="m4",
+                CONFIGURED_BISON="byacc",
+                TMPDIR="/tmp",
+                LIBS="",
+                CC_FOR_BUILD=str(self.host_CC),
+                CXX_FOR_BUILD=str(self.host_CXX),
+                CFLAGS_FOR_BUILD="-g -fcommon",
+                CXXFLAGS_FOR_BUILD="-g -fcommon",
+            )
 
         if self.make_args.command == "gmake":
             self.configure_environment["MAKE"] = "gmake"
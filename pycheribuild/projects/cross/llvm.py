@@ -27,6 +27,7 @@
 # OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF
 # SUCH DAMAGE.
 #
+import concurrent.futures
 import os
 import sys
 from pathlib import Path
@@ -376,7 +377,7 @@ class BuildLLVMBase(CMakeProject):
     @staticmethod
     def clang_install_hint() -> InstallInstructions:
         alternative = None
-        if OSInfo.is_ubuntu() or OSInfo.is_debian():
+        if OSInfo.uses_apt():
             alternative = """if the repository version is too old, try running:
 sudo apt install software-properties-common
 sudo bash -c "$(wget -O - https://apt.llvm.org/llvm.sh)"
@@ -449,8 +450,9 @@ sudo bash -c "$(wget -O - https://apt.llvm.org/llvm.sh)"
                 tool_name="cpp",
                 create_unprefixed_link=False,
             )
-            for tool in ("clang", "clang++", "clang-cpp"):
-                self.create_triple_prefixed_symlinks(self.install_dir / "bin" / tool)
+            self.create_triple_prefixed_symlinks_for_tools(
+                self.install_dir / "bin" / tool for tool in ("clang", "clang++", "clang-cpp")
+            )
 
             # Ensure that the installed clang can find the C++ headers:
             if OSInfo.IS_MAC and Path("/Library/Developer/CommandLineTools/usr/include/c++/v1").is_dir():
@@ -853,22 +855,28 @@ class BuildLLVMSplitRepoBase(BuildLLVMBase):
         )
 
     def update(self):
+        # The tools/<name> checkouts are nested inside the LLVM checkout, so that one has to be updated first.
         super().update()
+        subprojects = []
         if "clang" in self.included_projects:
-            GitRepository(self.clang_repository).update(
-                self,
-                src_dir=self.source_dir / "tools/clang",
-                revision=self.clang_revision,
-            )
+            subprojects.append(("clang", self.clang_repository, self.clang_revision))
         if "lld" in self.included_projects:
-            GitRepository(self.lld_repository).update(
-                self,
-                src_dir=self.source_dir / "tools/lld",
-                revision=self.lld_revision,
-            )
+            subprojects.append(("lld", self.lld_repository, self.lld_revision))
         if "lldb" in self.included_projects:  # Not yet usable
-            GitRepository(self.lldb_repository).update(
-                self,
-                src_dir=self.source_dir / "tools/lldb",
-                revision=self.lldb_revision,
-            )
+            subprojects.append(("lldb", self.lldb_repository, self.lldb_revision))
+
+        def update_subproject(name: str, repository: str, revision: "Optional[str]") -> None:
+            GitRepository(repository).update(self, src_dir=self.source_dir / "tools" / name, revision=revision)
+
+        # The subprojects use disjoint directories and updating them is mostly waiting for the network, so we can
+        # update them in parallel. However, both query_yes_no() and the git child processes (ssh passphrases, HTTPS
+        # credentials, host keys) may prompt on the terminal, so we only do this if stdin is not a TTY. Even with
+        # --force concurrent prompts would interleave. We also skip it in pretend mode to keep the output deterministic.
+        if len(subprojects) > 1 and not sys.__stdin__.isatty() and not self.config.pretend:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(subprojects)) as executor:
+                futures = [executor.submit(update_subproject, *args) for args in subprojects]
+                for future in futures:
+                    future.result()
+        else:
+            for args in subprojects:
+                update_subproject(*args)
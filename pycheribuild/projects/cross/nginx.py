@@ -96,28 +96,33 @@ class BuildNginx(CrossCompileAutotoolsProject):
         )
         if not self.compiling_for_host():
             self.LDFLAGS.append("-v")
+            # default_compiler_flags/default_ldflags are recomputed on every access, so only quote them once.
+            cc_opt = self.commandline_to_str(self.default_compiler_flags)
+            ld_opt = self.commandline_to_str(self.default_ldflags)
             self.configure_args.extend(
                 [
                     "--crossbuild=FreeBSD:12.0-CURRENT:mips",
-                    "--with-cc-opt=" + self.commandline_to_str(self.default_compiler_flags),
-                    "--with-ld-opt=" + self.commandline_to_str(self.default_ldflags),
+                    "--with-cc-opt=" + cc_opt,
+                    "--with-ld-opt=" + ld_opt,
                     "--sysroot=" + str(self.sdk_sysroot),
                 ]
             )
-            self.configure_environment["CC_TEST_FLAGS"] = self.commandline_to_str(self.default_compiler_flags)
-            self.configure_environment["NGX_TEST_LD_OPT"] = self.commandline_to_str(self.default_ldflags)
-            self.configure_environment["NGX_SIZEOF_int"] = "4"
-            self.configure_environment["NGX_SIZEOF_sig_atomic_t"] = "4"  # on mips it is an int
-            self.configure_environment["NGX_SIZEOF_long"] = "8"
-            self.configure_environment["NGX_SIZEOF_long_long"] = "8"
-            self.configure_environment["NGX_SIZEOF_size_t"] = "8"
-            self.configure_environment["NGX_SIZEOF_off_t"] = "8"
-            self.configure_environment["NGX_SIZEOF_time_t"] = "8"
-            self.configure_environment["NGX_SIZEOF_void_p"] = str(self.target_info.pointer_size)
-            self.configure_environment["NGX_HAVE_MAP_DEVZERO"] = "yes"
-            self.configure_environment["NGX_HAVE_SYSVSHM"] = "yes"
-            self.configure_environment["NGX_HAVE_MAP_ANON"] = "yes"
-            self.configure_environment["NGX_HAVE_POSIX_SEM"] = "yes"
+            self.configure_environment.update(
+                CC_TEST_FLAGS=cc_opt,
+                NGX_TEST_LD_OPT=ld_opt,
+                NGX_SIZEOF_int="4",
+                NGX_SIZEOF_sig_atomic_t="4",  # on mips it is an int
+                NGX_SIZEOF_long="8",
+                NGX_SIZEOF_long_long="8",
+                NGX_SIZEOF_size_t="8",
+                NGX_SIZEOF_off_t="8",
+                NGX_SIZEOF_time_t="8",
+                NGX_SIZEOF_void_p=str(self.target_info.pointer_size),
+                NGX_HAVE_MAP_DEVZERO="yes",
+                NGX_HAVE_SYSVSHM="yes",
+                NGX_HAVE_MAP_ANON="yes",
+                NGX_HAVE_POSIX_SEM="yes",
+            )
         super().configure(cwd=self.source_dir)
 
     def compile(self, **kwargs):
@@ -40,7 +40,7 @@ import time
 import typing
 from collections import OrderedDict
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Callable, Optional, Sequence, Union
 
@@ -1772,6 +1772,15 @@ add_custom_target(cheribuild-full VERBATIM USES_TERMINAL COMMAND {command} {targ
                     self.install()
 
 
+_TOOLCHAIN_FILE_PLACEHOLDER_RE = re.compile(r"@(\w+)@")
+
+
+# The toolchain file templates are cached by include_local_file(), so we only need to scan them for placeholders once.
+@lru_cache(maxsize=20)
+def _toolchain_file_placeholders(template: str) -> "frozenset[str]":
+    return frozenset(_TOOLCHAIN_FILE_PLACEHOLDER_RE.findall(template))
+
+
 # Shared between meson and CMake
 class _CMakeAndMesonSharedLogic(Project):
     do_not_add_to_targets: bool = True
@@ -1817,42 +1826,44 @@ class _CMakeAndMesonSharedLogic(Project):
     def _bool_to_str(self, value: bool) -> str:
         raise NotImplementedError()
 
-    def _replace_value(self, template: str, required: bool, key: str, value: str) -> str:
-        result = template
+    def _toolchain_file_value_to_str(self, key: str, value) -> str:
         if isinstance(value, bool):
-            strval = self._bool_to_str(value)
+            return self._bool_to_str(value)
         elif isinstance(value, _CMakeAndMesonSharedLogic.CommandLineArgs):
-            # The CMake toolchain file generated by Meson uses a CMake list for compiler args, but that results in
-            # CMake calling `clang -target;foo;--sysroot=...". We have to use a space-separated list instead, so we
-            # also expand @{KEY}_STR@ (but don't make it an error if it doesn't exist in the toolchain file).
-            # Feature request: https://github.com/mesonbuild/meson/issues/8534
-            result = self._replace_value(result, required=False, key=key + "_STR", value=commandline_to_str(value.args))
-            strval = self._toolchain_file_command_args_to_str(value)
+            return self._toolchain_file_command_args_to_str(value)
         elif isinstance(value, _CMakeAndMesonSharedLogic.EnvVarPathList):
-            strval = self._toolchain_file_env_var_path_list_to_str(value)
+            return self._toolchain_file_env_var_path_list_to_str(value)
         elif isinstance(value, list):
-            strval = self._toolchain_file_list_to_str(value)
-        else:
-            if not isinstance(value, (str, Path, int)):
-                self.fatal(f"Unexpected value type {type(value)} for {key}: {value}", fatal_when_pretending=True)
-            strval = str(value)
-        result = result.replace("@" + key + "@", strval)
-        if required and result == template:
-            raise ValueError(key + " not used in toolchain file")
-        return result
+            return self._toolchain_file_list_to_str(value)
+        if not isinstance(value, (str, Path, int)):
+            self.fatal(f"Unexpected value type {type(value)} for {key}: {value}", fatal_when_pretending=True)
+        return str(value)
 
     @property
     def cmake_prefix_paths(self):
         return remove_duplicates(self.target_info.cmake_prefix_paths(self.config) + self.dependency_install_prefixes)
 
     def _replace_values_in_toolchain_file(self, template: str, file: Path, **kwargs) -> None:
-        result = template
+        placeholders = _toolchain_file_placeholders(template)
+        replacements: "dict[str, str]" = {}
         for key, value in kwargs.items():
             if value is None:
                 continue
-            result = self._replace_value(result, required=True, key=key, value=value)
-        not_substituted = re.search(r"@[\w_\d]+@", result)
-        if not_substituted:
+            if isinstance(value, _CMakeAndMesonSharedLogic.CommandLineArgs):
+                # The CMake toolchain file generated by Meson uses a CMake list for compiler args, but that results in
+                # CMake calling `clang -target;foo;--sysroot=...". We have to use a space-separated list instead, so
+                # we also expand @{KEY}_STR@ (but don't make it an error if it doesn't exist in the toolchain file).
+                # Feature request: https://github.com/mesonbuild/meson/issues/8534
+                replacements[key + "_STR"] = commandline_to_str(value.args)
+            # CommandLineArgs keys may only be used in their @{KEY}_STR@ form.
+            if key not in placeholders and key + "_STR" not in placeholders:
+                raise ValueError(key + " not used in toolchain file")
+            replacements[key] = self._toolchain_file_value_to_str(key, value)
+        missing = placeholders - replacements.keys()
+        if missing:
+            not_substituted = next(
+                m for m in _TOOLCHAIN_FILE_PLACEHOLDER_RE.finditer(template) if m.group(1) in missing
+            )
             self.fatal(
                 "Did not replace all keys, found",
                 not_substituted.group(0),
@@ -1860,6 +1871,13 @@ class _CMakeAndMesonSharedLogic(Project):
                 not_substituted.span(),
                 fatal_when_pretending=True,
             )
+        # Expand all @KEY@ placeholders in a single pass over the template instead of one str.replace() per key.
+        result = _TOOLCHAIN_FILE_PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], template)
+        # Don't touch the file if the contents are unchanged: updating the timestamp of the toolchain file causes
+        # CMake to discard the cached compiler checks and re-run them on the next build.
+        if file.is_file() and self.read_file(file) == result:
+            self.verbose_print("Not updating", file, "since the contents are unchanged")
+            return
         self.write_file(contents=result, file=file, overwrite=True)
 
     def _prepare_toolchain_file_common(self, output_file: "Optional[Path]" = None, **kwargs) -> None:
@@ -1874,6 +1892,8 @@ class _CMakeAndMesonSharedLogic(Project):
             # Meson expects lower-case system names:
             # https://mesonbuild.com/Reference-tables.html#operating-system-names
             system_name = system_name.lower()
+        # default_ldflags is recomputed on every access, so only evaluate it once for both linker flag variables.
+        ldflags = self.default_ldflags + self.LDFLAGS
         self._replace_values_in_toolchain_file(
             self._toolchain_template,
             output_file,
@@ -1882,12 +1902,8 @@ class _CMakeAndMesonSharedLogic(Project):
             TOOLCHAIN_TARGET_TRIPLE=self.target_info.target_triple,
             TOOLCHAIN_COMMON_FLAGS=cmdline(self.default_compiler_flags),
             TOOLCHAIN_C_FLAGS=cmdline(self.CFLAGS),
-            TOOLCHAIN_EXE_LINKER_FLAGS=cmdline(
-                self.default_ldflags + self.LDFLAGS + self.target_info.additional_executable_link_flags,
-            ),
-            TOOLCHAIN_SHARED_LINKER_FLAGS=cmdline(
-                self.default_ldflags + self.LDFLAGS + self.target_info.additional_shared_library_link_flags,
-            ),
+            TOOLCHAIN_EXE_LINKER_FLAGS=cmdline(ldflags + self.target_info.additional_executable_link_flags),
+            TOOLCHAIN_SHARED_LINKER_FLAGS=cmdline(ldflags + self.target_info.additional_shared_library_link_flags),
             TOOLCHAIN_CXX_FLAGS=cmdline(self.CXXFLAGS),
             TOOLCHAIN_ASM_FLAGS=cmdline(self.ASMFLAGS),
             TOOLCHAIN_C_COMPILER=self.CC,
@@ -2007,7 +2023,7 @@ class AutotoolsProject(Project):
 
     def setup(self) -> None:
         super().setup()
-        buildhost = self.get_host_triple()
+        # Note: get_host_triple() may have to run the host compiler, so we only call it if --build= is needed.
         if self.add_host_target_build_config_options:
             if not self.compiling_for_host():
                 autotools_triple = self.target_info.target_triple
@@ -2016,12 +2032,12 @@ class AutotoolsProject(Project):
                 # TODO: do we have to remove these too?
                 # autotools_triple = autotools_triple.replace("mips64c128-", "cheri-")
                 self.configure_args.extend(
-                    ["--host=" + autotools_triple, "--target=" + autotools_triple, "--build=" + buildhost]
+                    ["--host=" + autotools_triple, "--target=" + autotools_triple, "--build=" + self.get_host_triple()]
                 )
             elif self.crosscompile_target.is_hybrid_or_purecap_cheri():
                 # When compiling natively on CheriBSD, most autotools projects don't like the inferred config.guess
                 # value of aarch64c-unknown-freebsd14.0. Override it to make this work in most cases.
-                self.configure_args.extend(["--build=" + buildhost])
+                self.configure_args.extend(["--build=" + self.get_host_triple()])
         if self.config.verbose:
             # Most autotools-base projects enable verbose output by setting V=1
             self.make_args.set_env(V=1)
@@ -2111,10 +2127,11 @@ class MakefileProject(Project):
 
         # Set values in the environment so that projects can override them
         cppflags = self.default_compiler_flags
+        cflags = commandline_to_str(cppflags + self.CFLAGS)  # CPPFLAGS uses the same value, only quote it once
         self.make_args.set_env(
-            CFLAGS=commandline_to_str(cppflags + self.CFLAGS),
+            CFLAGS=cflags,
             CXXFLAGS=commandline_to_str(cppflags + self.CXXFLAGS),
-            CPPFLAGS=commandline_to_str(cppflags + self.CFLAGS),
+            CPPFLAGS=cflags,
             LDFLAGS=commandline_to_str(self.default_ldflags + self.LDFLAGS),
         )
 
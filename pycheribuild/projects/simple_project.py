@@ -825,7 +825,7 @@ class SimpleProject(AbstractProject, metaclass=ABCMeta if typing.TYPE_CHECKING e
     def cheri_config_suffix(self):
         return self.crosscompile_target.cheri_config_suffix(self.config)
 
-    @property
+    @functools.cached_property
     def sdk_bindir(self) -> Path:
         return self.target_info.sdk_root_dir / "bin"
 
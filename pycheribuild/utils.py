@@ -277,7 +277,9 @@ def query_yes_no(
     return str(result).lower().startswith("y")  # anything but y will be treated as false
 
 
-@functools.lru_cache(maxsize=20)
+# The set of bundled files is small and fixed, so cache all of them instead of using a bounded LRU cache (there are
+# more than 20 distinct files, so a bounded cache would evict e.g. the CMake toolchain template between projects).
+@functools.lru_cache(maxsize=None)
 def include_local_file(path: str) -> str:
     file = Path(__file__).parent / path
     if not file.is_file():
@@ -396,7 +398,8 @@ class OSInfo:
     def __is_linux_distribution(cls, kind):
         if not cls.IS_LINUX:
             return False
-        return kind in cls.etc_os_release().get("ID", "") or kind in cls.etc_os_release().get("ID_LIKE", "")
+        os_release = cls.etc_os_release()
+        return kind in os_release.get("ID", "") or kind in os_release.get("ID_LIKE", "")
 
     @staticmethod
     def etc_os_release() -> "dict[str, str]":
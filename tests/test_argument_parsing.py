@@ -3,6 +3,7 @@ import inspect
 import re
 import sys
 import tempfile
+import threading
 import typing
 from enum import Enum
 
@@ -33,11 +34,12 @@ from pycheribuild.projects.cross.qt5 import BuildQtBase
 
 # noinspection PyProtectedMember
 from pycheribuild.projects.disk_image import BuildCheriBSDDiskImage, BuildDiskImageBase
-from pycheribuild.projects.project import Project
+from pycheribuild.projects.project import GitRepository, Project
 from pycheribuild.projects.run_qemu import LaunchCheriBSD
 
 # Override the default config loader:
 from pycheribuild.projects.simple_project import SimpleProject
+from pycheribuild.projects.soaap import BuildSoaapLLVM
 from pycheribuild.targets import MultiArchTargetAlias, Target, target_manager
 
 Target.instantiating_targets_should_warn = False
@@ -1548,3 +1550,35 @@ def test_host_prefixes_and_install_dir():
         Path("/output/local"),
         Path("/output/bootstrap"),
     ]
+
+
+@pytest.mark.parametrize("stdin_isatty", [False, True])
+def test_llvm_split_repo_subproject_update(monkeypatch, stdin_isatty: bool):
+    config = _parse_arguments(["--force"])
+    monkeypatch.setattr(config, "pretend", False)
+    project = _get_target_instance("soaap-llvm", config, BuildSoaapLLVM)
+    monkeypatch.setattr(project, "included_projects", ["llvm", "clang", "lld"])
+    monkeypatch.setattr(project, "lld_repository", "https://example.org/lld.git", raising=False)
+    monkeypatch.setattr(project, "lld_revision", None, raising=False)
+    monkeypatch.setattr(sys, "__stdin__", type("FakeStdin", (), {"isatty": lambda self: stdin_isatty})())
+    # The subproject updates must only run concurrently if stdin is not a TTY, since git may prompt for input
+    # (even with --force). If they run sequentially, the first update will wait on the barrier until it times out.
+    barrier = threading.Barrier(2, timeout=5)
+    updated: "list[tuple[Path, Optional[str]]]" = []
+
+    def fake_update(repo: GitRepository, current_project, *, src_dir: Path, **kwargs):
+        if src_dir.parent == project.source_dir / "tools":
+            if stdin_isatty:
+                assert threading.current_thread() is threading.main_thread()
+            else:
+                barrier.wait()
+        updated.append((src_dir, repo.url))
+
+    monkeypatch.setattr(GitRepository, "update", fake_update)
+    project.update()
+    # The LLVM checkout must be updated first since the subprojects are nested inside it.
+    assert updated[0] == (project.source_dir, "https://github.com/CTSRD-SOAAP/llvm.git")
+    assert sorted(updated[1:]) == [
+        (project.source_dir / "tools/clang", "https://github.com/CTSRD-SOAAP/clang.git"),
+        (project.source_dir / "tools/lld", "https://example.org/lld.git"),
+    ]
@@ -0,0 +1,91 @@
+import subprocess
+
+import pytest
+
+from .setup_mock_chericonfig import setup_mock_chericonfig
+from pycheribuild import processutils
+from pycheribuild.processutils import get_compiler_info
+
+GCC_OUTPUT = b"""Using built-in specs.
+COLLECT_GCC=gcc
+COLLECT_LTO_WRAPPER=/usr/lib/gcc/x86_64-linux-gnu/11/lto-wrapper
+Target: x86_64-linux-gnu
+Configured with: ../src/configure -v --with-pkgversion='Ubuntu 11.4.0-1ubuntu1~22.04' --enable-languages=c,c++ \
+--prefix=/usr --with-gcc-major-version-only --program-suffix=-11 --enable-checking=release
+Thread model: posix
+Supported LTO compression algorithms: zlib zstd
+gcc version 11.4.0 (Ubuntu 11.4.0-1ubuntu1~22.04)
+"""
+APPLE_CLANG_OUTPUT = b"""Apple clang version 15.0.0 (clang-1500.3.9.4)
+Target: arm64-apple-darwin23.4.0
+Thread model: posix
+InstalledDir: /Library/Developer/CommandLineTools/usr/bin
+"""
+APPLE_LLVM_OUTPUT = b"""Apple LLVM version 10.0.0 (clang-1000.11.45.5)
+Target: x86_64-apple-darwin18.2.0
+Thread model: posix
+InstalledDir: /Applications/Xcode.app/Contents/Developer/Toolchains/XcodeDefault.xctoolchain/usr/bin
+"""
+UBUNTU_CLANG_OUTPUT = b"""Ubuntu clang version 14.0.0-1ubuntu1.1
+Target: x86_64-pc-linux-gnu
+Thread model: posix
+InstalledDir: /usr/bin
+Found candidate GCC installation: /usr/bin/../lib/gcc/x86_64-linux-gnu/11
+Selected GCC installation: /usr/bin/../lib/gcc/x86_64-linux-gnu/11
+"""
+CHERI_CLANG_OUTPUT = b"""clang version 17.0.0 (https://github.com/CTSRD-CHERI/llvm-project.git 1f2e4b5c3d7a)
+Target: x86_64-unknown-linux-gnu
+Thread model: posix
+InstalledDir: /home/user/cheri/output/sdk/bin
+"""
+
+
+@pytest.mark.parametrize(
+    ("output", "kind", "version", "version_str", "default_target"),
+    [
+        pytest.param(GCC_OUTPUT, "gcc", (11, 4, 0), "gcc version 11.4.0", "x86_64-linux-gnu", id="gcc"),
+        pytest.param(
+            APPLE_CLANG_OUTPUT,
+            "apple-clang",
+            (15, 0, 0),
+            "Apple clang version 15.0.0",
+            "arm64-apple-darwin23.4.0",
+            id="apple-clang",
+        ),
+        pytest.param(
+            APPLE_LLVM_OUTPUT,
+            "apple-clang",
+            (10, 0, 0),
+            "Apple LLVM version 10.0.0",
+            "x86_64-apple-darwin18.2.0",
+            id="apple-llvm",
+        ),
+        pytest.param(
+            UBUNTU_CLANG_OUTPUT, "clang", (14, 0, 0), "clang version 14.0.0", "x86_64-pc-linux-gnu", id="ubuntu-clang"
+        ),
+        pytest.param(
+            CHERI_CLANG_OUTPUT,
+            "clang",
+            (17, 0, 0),
+            "clang version 17.0.0",
+            "x86_64-unknown-linux-gnu",
+            id="cheri-clang",
+        ),
+    ],
+)
+def test_get_compiler_info(tmp_path, monkeypatch, output: bytes, kind: str, version, version_str, default_target):
+    config = setup_mock_chericonfig(tmp_path)
+    compiler = tmp_path / "cc"
+    compiler.touch()
+
+    def fake_run_command(*args, **kwargs):
+        assert args == (compiler.resolve(), "-v")
+        return subprocess.CompletedProcess(args, 0, b"", output)
+
+    monkeypatch.setattr(processutils, "run_command", fake_run_command)
+    monkeypatch.setattr(processutils, "_cached_compiler_infos", {})
+    info = get_compiler_info(compiler, config=config)
+    assert info.compiler == kind
+    assert info.version == version
+    assert info.version_str == version_str
+    assert info.default_target == default_target
@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from .setup_mock_chericonfig import setup_mock_chericonfig
+from pycheribuild.filesystemutils import FileSystemUtils
+
+
+def _check_symlink(link: Path, target: str) -> None:
+    assert link.is_symlink()
+    assert os.readlink(link) == target
+    assert not link.with_name(link.name + ".tmp-symlink").exists()
+
+
+def test_force_symlink(tmp_path):
+    fs = FileSystemUtils(setup_mock_chericonfig(tmp_path, pretend=False))
+    (tmp_path / "clang").touch()
+    (tmp_path / "clang++").touch()
+    (tmp_path / "subdir").mkdir()
+    link = tmp_path / "cc"
+    # Create a new link
+    fs._force_symlink("clang", link)
+    _check_symlink(link, "clang")
+    # Replace an existing symlink
+    fs._force_symlink("clang++", link)
+    _check_symlink(link, "clang++")
+    # Replace a symlink to a directory instead of creating a link inside it (ln -n)
+    fs._force_symlink("subdir", link)
+    fs._force_symlink("clang", link)
+    _check_symlink(link, "clang")
+    assert list((tmp_path / "subdir").iterdir()) == []
+    # Replace a regular file
+    link.unlink()
+    link.write_text("not a symlink")
+    fs._force_symlink("clang", link)
+    _check_symlink(link, "clang")
+    # Leftover temporary symlinks (e.g. from an interrupted run) are removed
+    os.symlink("stale", tmp_path / "cc.tmp-symlink")
+    fs._force_symlink("clang++", link)
+    _check_symlink(link, "clang++")
+    # Replacing a real directory is an error
+    with pytest.raises(SystemExit):
+        fs._force_symlink("clang", tmp_path / "subdir")
+    assert (tmp_path / "subdir").is_dir()
+    assert not (tmp_path / "subdir").is_symlink()
+    assert list((tmp_path / "subdir").iterdir()) == []
+
+
+def test_force_symlink_pretend(tmp_path):
+    fs = FileSystemUtils(setup_mock_chericonfig(tmp_path, pretend=True))
+    fs._force_symlink("clang", tmp_path / "cc")
+    assert not (tmp_path / "cc").is_symlink()
@@ -1,3 +1,4 @@
+import os
 import re
 from pathlib import Path
 
@@ -49,3 +50,42 @@ def test_add_cmake_option():
         add_options_test([], BYTE_OPTION=b"abc")
     with pytest.raises(TypeError, match=re.escape("Unsupported type <class 'tuple'>: ('abc',)")):
         add_options_test([], TUPLE_OPTION=("abc",))
+
+
+def test_replace_values_in_toolchain_file(tmp_path):
+    class TestCMakeProject(CMakeProject):
+        target = "fake-cmake-project-toolchain"
+        repository = ExternallyManagedSourceRepository()
+        default_install_dir = DefaultInstallDir.DO_NOT_INSTALL
+
+    config: CheriConfig = setup_mock_chericonfig(tmp_path, pretend=False)
+    target_manager.reset()
+    TestCMakeProject.setup_config_options()
+    test_project = TestCMakeProject(config, crosscompile_target=BasicCompilationTargets.NATIVE_NON_PURECAP)
+    cmdline = CMakeProject.CommandLineArgs
+    output = tmp_path / "toolchain.cmake"
+    template = 'set(A @A@)\nset(B @B@)\nset(FLAGS @FLAGS@)\nset(FLAGS_STR "@FLAGS_STR@")\nset(A2 @A@)\n'
+    test_project._replace_values_in_toolchain_file(
+        template, output, A="@B@", B=True, FLAGS=cmdline(["-a", "b c"]), UNSET=None
+    )
+    # Substituted values must not be expanded again.
+    assert (
+        output.read_text() == "set(A @B@)\nset(B TRUE)\nset(FLAGS -a 'b c')\nset(FLAGS_STR \"-a 'b c'\")\nset(A2 @B@)\n"
+    )
+    # The file should not be rewritten if the contents are unchanged.
+    os.utime(output, ns=(0, 0))
+    test_project._replace_values_in_toolchain_file(
+        template, output, A="@B@", B=True, FLAGS=cmdline(["-a", "b c"]), UNSET=None
+    )
+    assert output.stat().st_mtime_ns == 0
+    test_project._replace_values_in_toolchain_file(template, output, A=1, B=2, FLAGS=cmdline([]))
+    assert output.stat().st_mtime_ns != 0
+    assert output.read_text() == 'set(A 1)\nset(B 2)\nset(FLAGS )\nset(FLAGS_STR "")\nset(A2 1)\n'
+    with pytest.raises(ValueError, match="C not used in toolchain file"):
+        test_project._replace_values_in_toolchain_file(template, output, A=1, B=2, C=3, FLAGS=cmdline([]))
+    # Keys that are only used as @KEY_STR@ count as being used.
+    test_project._replace_values_in_toolchain_file("x @FLAGS_STR@", output, FLAGS=cmdline(["-a"]))
+    assert output.read_text() == "x -a"
+    # All placeholders must be replaced.
+    with pytest.raises(SystemExit):
+        test_project._replace_values_in_toolchain_file(template, output, A=1, FLAGS=cmdline([]))